@@ -16,36 +16,38 @@ This module is used to generate the table of Unicode code point categories
 that are used to parse tokens in Peejay.
 """
 
-from collections.abc import MutableSequence
-from enum import Enum
-from typing import Annotated, Generator, Optional, Sequence
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from enum import IntEnum
+from itertools import chain
+from types import MappingProxyType
+from typing import Annotated, NamedTuple, Optional
 import argparse
 import pathlib
+import re
+import sys
 
-from unicode_data import CodePoint, CodePointValueDict, DbDict, GeneralCategory,\
-                         MAX_CODE_POINT, read_unicode_data
-
-CodePointBitsType = Annotated[
-    int, 'The number of bits used to represent a code point']
-CODE_POINT_BITS: CodePointBitsType = 21
-
-RunLengthBitsType = Annotated[
-    int, 'The number of bits used to represent a run length']
-RUN_LENGTH_BITS: RunLengthBitsType = 9
-MAX_RUN_LENGTH = pow(2, RUN_LENGTH_BITS) - 1
+from unicode_data import CodePoint, DbDict, GeneralCategory,\
+                         GENERAL_CATEGORY_ABBR_TO_ENUM, MAX_CODE_POINT,\
+                         read_unicode_data
 
 RuleBitsType = Annotated[int, 'The number of bits used to represent a rule']
 RULE_BITS: RuleBitsType = 2
-MAX_RULE = pow(2, RULE_BITS) - 1
+MAX_RULE = (1 << RULE_BITS) - 1
 
 
-class GrammarRule(Enum):
+class GrammarRule(IntEnum):
     """The roles that each known code-point may serve."""
     WHITESPACE = 0b00
     IDENTIFIER_START = 0b01
     IDENTIFIER_PART = 0b11
 
 
+# Every rule value must fit in the RULE_BITS bits allotted to it in a packed
+# rule table. Checking this once here makes a check of each entry unnecessary.
+assert all(x <= MAX_RULE for x in GrammarRule)
+
+
 def rule_name (rule: GrammarRule) -> str:
     """Converts a GrammerRule name using the Python naming convention (all
     upper-case) to the PJ C++ convention of using snake-case."""
@@ -58,7 +60,7 @@ def rule_name (rule: GrammarRule) -> str:
     return rule_to_str_map[rule]
 
 
-CATEGORY_TO_GRAMMAR_RULE: dict[GeneralCategory, GrammarRule] = {
+CATEGORY_TO_GRAMMAR_RULE: Mapping[GeneralCategory, GrammarRule] = MappingProxyType({
     GeneralCategory.Spacing_Mark: GrammarRule.IDENTIFIER_PART,
     GeneralCategory.Connector_Punctuation: GrammarRule.IDENTIFIER_PART,
     GeneralCategory.Decimal_Number: GrammarRule.IDENTIFIER_PART,
@@ -70,196 +72,462 @@ CATEGORY_TO_GRAMMAR_RULE: dict[GeneralCategory, GrammarRule] = {
     GeneralCategory.Other_Letter: GrammarRule.IDENTIFIER_START,
     GeneralCategory.Titlecase_Letter: GrammarRule.IDENTIFIER_START,
     GeneralCategory.Uppercase_Letter: GrammarRule.IDENTIFIER_START,
-}
-
+})
+
+
+# The individual code points to which the ECMAScript grammar assigns a rule
+# regardless of their General_Category.
+SPECIAL_CODE_POINTS: Mapping[CodePoint, GrammarRule] = MappingProxyType({
+    CodePoint(0x0009): GrammarRule.WHITESPACE,
+    CodePoint(0x000A): GrammarRule.WHITESPACE,
+    CodePoint(0x000B): GrammarRule.WHITESPACE,
+    CodePoint(0x000C): GrammarRule.WHITESPACE,
+    CodePoint(0x000D): GrammarRule.WHITESPACE,
+    CodePoint(0x0020): GrammarRule.WHITESPACE,
+    CodePoint(0x0024): GrammarRule.IDENTIFIER_START,
+    CodePoint(0x005F): GrammarRule.IDENTIFIER_START,
+    CodePoint(0x00A0): GrammarRule.WHITESPACE,
+    CodePoint(0x200C): GrammarRule.IDENTIFIER_PART,
+    CodePoint(0x200D): GrammarRule.IDENTIFIER_PART,
+    CodePoint(0xFEFF): GrammarRule.WHITESPACE,
+})
+
+
+class CodeRuns(NamedTuple):
+    """The runs of Unicode code points which each belong to a single rule. The
+    runs are held as three parallel arrays sorted by code point."""
+
+    code_points: array  # The first code point of each run.
+    lengths: array  # The number of code points in each run.
+    rules: array  # The GrammarRule value of each run.
+
+
+def format_run(code_point: CodePoint, length: int, rule: int,
+               names: Mapping[CodePoint, str],
+               rule_names: Mapping[int, str]) -> str:
+    """Produces the C++ initializer for the first code point of a run along
+    with a comment describing the run.
+
+    :param code_point: The first code point of the run.
+    :param length: The number of code points in the run.
+    :param rule: The GrammarRule value of the run.
+    :param names: A mapping from code point to its name.
+    :param rule_names: A mapping from GrammarRule value to its C++ name.
+    :return: A string containing the initializer and a comment.
+    """
 
-class OutputRow:
-    """An individual output row representing a run of Unicode code points
-    which all belong to the same rule."""
-
-    def __init__(self, code_point: CodePoint, length: int,
-                 category: GrammarRule):
-        assert code_point < pow(2, CODE_POINT_BITS)
-        self.__code_point: CodePoint = code_point
-        assert length < pow(2, RUN_LENGTH_BITS)
-        self.__length: int = length
-        assert category.value < pow(2, RULE_BITS)
-        self.__category: GrammarRule = category
-
-    def as_str(self, database: DbDict) -> str:
-        name = database[self.__code_point]['Name']
-        return f'{{ 0x{self.__code_point:04x}, {self.__length}, {self.__category.value} }}, // {name} ({rule_name (self.__category)})'
-
-
-class CRAState:
-    """A class used to model the state of code_run_array() as it processes
-    each unicode code point in sequence."""
-
-    def __init__(self) -> None:
-        self.__first: CodePoint = CodePoint(0)
-        self.__length: int = 0
-        self.__max_length: int = 0
-        self.__rule: Optional[GrammarRule] = None
-
-    def new_run(self, code_point: CodePoint,
-                rule: Optional[GrammarRule]) -> None:
-        """Start a new potential run of contiguous code points.
-
-        :param code_point: The code point at which the run may start.
-        :param rule: The rule associated with this code point or None.
-        :return: None
-        """
-
-        self.__first = code_point
-        self.__rule = rule
-        self.__length = int(rule is not None)
-
-    def extend_run(self, rule: Optional[GrammarRule]) -> bool:
-        """Adds a code point to the current run or indicates that a new run
-        should be started.
-
-        :param rule:
-        :return: True if the current run was extended or False if a new run
-                 should be started.
-        """
-
-        if self.__rule is not None and rule == self.__rule:
-            if self.__length > MAX_RUN_LENGTH:
-                return False
-            self.__length += 1
-            self.__max_length = max(self.__max_length, self.__length)
-            return True
-        return False
-
-    def end_run(
-            self,
-            result: MutableSequence[OutputRow]) -> MutableSequence[OutputRow]:
-        """Call at the end of a contiguous run of entries. If there are new
-        values, a new Entry will be appended to the 'result' sequence.
-
-        :param result: The sequence to which a new entry may be appended.
-        :return: The value 'result'.
-        """
-
-        if self.__length > 0 and self.__rule is not None:
-            assert self.__first <= MAX_CODE_POINT
-            assert self.__length <= MAX_RUN_LENGTH
-            assert self.__rule.value <= MAX_RULE
-            result.append(OutputRow(self.__first, self.__length, self.__rule))
-        return result
-
-    def max_run(self) -> int:
-        """The length of the longest contiguous run that has been encountered."""
-        return self.__max_length
-
-
-def all_code_points() -> Generator[CodePoint, None, None]:
-    """A generator which yields all of the valid Unicode code points in
-    sequence."""
-
-    code_point = CodePoint(0)
-    while code_point <= MAX_CODE_POINT:
-        yield code_point
-        code_point = CodePoint(code_point + 1)
-
-
-def code_run_array(database: DbDict) -> list[OutputRow]:
-    """Produces an array of code runs from the Unicode database dictionary.
-
-    :param database: The Unicode database dictionary.
-    :return: An array of code point runs.
+    last = code_point + length - 1
+    return f'0x{code_point:04x}, // U+{code_point:04X}..U+{last:04X} {names[code_point]} ({rule_names[rule]})'
+
+
+# The value used in a rule table for a code point which does not belong to any
+# grammar rule.
+NO_RULE = 0xFF
+
+# The two-bit value which represents NO_RULE in a packed rule table. This is
+# the one two-bit value which is not used by a GrammarRule.
+PACKED_NO_RULE = 0b10
+assert all(x != PACKED_NO_RULE for x in GrammarRule)
+# A bytes.translate() table which maps NO_RULE to PACKED_NO_RULE.
+_TO_TWO_BITS = bytes(PACKED_NO_RULE if x == NO_RULE else x for x in range(256))
+
+# The number of code points in the ASCII range.
+ASCII_SIZE = 0x80
+
+# The range of page sizes (expressed as the number of bits of a code point used
+# to select an entry within a page) considered for a two-stage table.
+MIN_PAGE_BITS = 5
+MAX_PAGE_BITS = 10
+
+# Matches a run of identical bytes (other than NO_RULE) in a rule table.
+_RUN_RE = re.compile(rb'([^\xff])\1*', re.DOTALL)
+# Matches a run of NO_RULE bytes in a rule table.
+_NO_RULE_RUN_RE = re.compile(rb'\xff+')
+
+
+def read_rule_table(
+        unicode_data_path: pathlib.Path) -> tuple[bytearray, dict[CodePoint, str]]:
+    """Reads the UnicodeData.txt file and produces a table containing one byte
+    for every Unicode code point. Each byte holds the value of the GrammarRule
+    to which the code point belongs or NO_RULE. Only the code point, name, and
+    General_Category fields of each record are decoded and the rule is written
+    directly into the table: there is no intermediate database. The ranges of
+    code points described by pairs of <..., First> and <..., Last> records are
+    filled in their entirety.
+
+    :param unicode_data_path: The path of the UnicodeData.txt file.
+    :return: A tuple containing the table of MAX_CODE_POINT + 1 grammar rule
+             values and a dictionary which maps each code point listed in
+             the file to its name.
     """
 
-    state = CRAState()
-    code_runs: list[OutputRow] = []
-    for code_point in all_code_points():
-        rule: Optional[GrammarRule] = None
-        value: Optional[CodePointValueDict] = database.get(code_point)
-        if value is not None:
-            rule = CATEGORY_TO_GRAMMAR_RULE.get(value['General_Category'])
-            if state.extend_run(rule):
+    rules = bytearray([NO_RULE]) * (MAX_CODE_POINT + 1)
+    names: dict[CodePoint, str] = {}
+    # Resolve each category abbreviation to its rule once and bind the
+    # lookup to a local so that the loop body avoids repeated attribute
+    # lookups.
+    abbr_to_rule = {
+        abbr: CATEGORY_TO_GRAMMAR_RULE[category]
+        for abbr, category in GENERAL_CATEGORY_ABBR_TO_ENUM.items()
+        if category in CATEGORY_TO_GRAMMAR_RULE
+    }.get
+    # The first code point and name prefix of the most recent <..., First>
+    # record which has not yet been matched by a <..., Last> record.
+    range_first: Optional[CodePoint] = None
+    range_name = ''
+    with open(unicode_data_path, encoding='utf-8') as udb:
+        for line in udb:
+            # Skip blank lines (such as one at the end of the file).
+            if not line.strip():
                 continue
-        state.end_run(code_runs)
-        state.new_run(code_point, rule)
-    state.end_run(code_runs)
-    return code_runs
+            code_point, name, category, _ = line.split(';', 3)
+            cp = CodePoint(int(code_point, 16))
+            names[cp] = name
+            rule = abbr_to_rule(category, NO_RULE)
+            if name.endswith(', First>'):
+                range_first = cp
+                range_name = name[:-len(', First>')]
+            elif name.endswith(', Last>'):
+                # A pair of <..., First> and <..., Last> records stands for
+                # every code point in the range between them: they all share
+                # the same properties.
+                assert range_first is not None and range_first <= cp
+                assert name[:-len(', Last>')] == range_name
+                rules[range_first:cp + 1] = bytes([rule]) * (cp + 1 - range_first)
+                range_first = None
+                continue
+            rules[cp] = rule
+    return rules, names
+
+
+def code_run_array(rules: bytes) -> CodeRuns:
+    """Produces the runs of code points from a rule table.
+
+    :param rules: A rule table as produced by read_rule_table().
+    :return: The code point runs.
+    """
+
+    runs = CodeRuns(array('L'), array('L'), array('B'))
+    # The run boundaries are found by the regular expression engine so that we
+    # loop once per run rather than once per code point.
+    for match in _RUN_RE.finditer(rules):
+        first, last = match.span()
+        runs.code_points.append(first)
+        runs.lengths.append(last - first)
+        runs.rules.append(rules[first])
+    return runs
+
+
+def pack_rules(rules: bytes) -> bytes:
+    """Packs a sequence of rule values into two bits each, four to a byte. The
+    first value occupies the least significant bits of a byte. NO_RULE is
+    stored as PACKED_NO_RULE.
+
+    :param rules: A sequence of GrammarRule values or NO_RULE. The length must
+                  be a multiple of 4.
+    :return: The packed sequence.
+    """
+
+    assert len(rules) % 4 == 0
+    two_bit = rules.translate(_TO_TWO_BITS)
+    return bytes(two_bit[x] | (two_bit[x + 1] << 2) | (two_bit[x + 2] << 4)
+                 | (two_bit[x + 3] << 6) for x in range(0, len(two_bit), 4))
+
+
+class TwoStageTable(NamedTuple):
+    """A two-stage lookup table. The first stage maps the high bits of a code
+    point to a page number; the second stage holds the pages themselves with
+    their rules packed by pack_rules(). Code points from gap_first to gap_last
+    and from limit onwards have no rule: they are range checked rather than
+    being given entries in the first stage."""
+
+    page_bits: int  # The number of bits of a code point which index a page.
+    stage1: bytes
+    stage2: bytes
+    gap_first: int  # The first code point of the omitted gap.
+    gap_last: int  # The code point following the omitted gap.
+    limit: int  # The code point following the last page in the table.
 
 
-def patch_special_code_points(database: DbDict) -> DbDict:
+def two_stage_table(rules: bytes, page_bits: int) -> Optional[TwoStageTable]:
+    """Converts a rule table to a two-stage lookup table. The rule table is
+    divided into pages of 2^page_bits code points and duplicate pages are
+    removed.
+
+    :param rules: A rule table as produced by read_rule_table().
+    :param page_bits: The number of bits of a code point which index a page.
+    :return: The two-stage table or None if the number of distinct pages is
+             too large for a page number to fit in a byte.
+    """
+
+    page_size = 1 << page_bits
+    assert len(rules) % page_size == 0
+    # The pages which follow the last rule are omitted from the table.
+    limit = (len(rules.rstrip(bytes([NO_RULE]))) + page_size - 1) & ~(page_size - 1)
+    # As is the longest sequence of whole pages below limit with no rules.
+    gap_first, gap_last = limit, limit
+    for match in _NO_RULE_RUN_RE.finditer(rules, 0, limit):
+        first = (match.start() + page_size - 1) & ~(page_size - 1)
+        last = match.end() & ~(page_size - 1)
+        if last - first > gap_last - gap_first:
+            gap_first, gap_last = first, last
+
+    page_numbers: dict[bytes, int] = {}
+    stage1 = bytearray()
+    for first in chain(range(0, gap_first, page_size),
+                       range(gap_last, limit, page_size)):
+        page_number = page_numbers.setdefault(rules[first:first + page_size],
+                                              len(page_numbers))
+        if page_number > 0xFF:
+            return None
+        stage1.append(page_number)
+    return TwoStageTable(page_bits, bytes(stage1),
+                         pack_rules(b''.join(page_numbers)), gap_first,
+                         gap_last, limit)
+
+
+def smallest_two_stage_table(rules: bytes) -> TwoStageTable:
+    """Builds a two-stage lookup table for each of the page sizes from
+    2^MIN_PAGE_BITS to 2^MAX_PAGE_BITS and returns the one whose stages have
+    the smallest combined size.
+
+    :param rules: A rule table as produced by read_rule_table().
+    :return: The smallest two-stage table.
+    """
+
+    rules = bytes(rules)
+    tables = (two_stage_table(rules, page_bits)
+              for page_bits in range(MIN_PAGE_BITS, MAX_PAGE_BITS + 1))
+    return min((x for x in tables if x is not None),
+               key=lambda x: len(x.stage1) + len(x.stage2))
+
+
+def patch_special_code_points(rules: bytearray) -> bytearray:
     """The ECMAScript grammar rules assigns meaning to some individual Unicode
     code points as well as to entire categories of code point. This function
-    ensures that the individual code points belong to categories that will in
-    turn be mapped to the correct grammar_rule value.
+    ensures that the individual code points are mapped to the correct
+    grammar_rule value.
 
-    :param database: The Unicode database dictionary.
-    :return: The Unicode database dictionary.
+    :param rules: A rule table as produced by read_rule_table().
+    :return: The rule table.
     """
 
-    # Check that the GeneralCategory enumerations will be eventually mapped to
-    # the grammar_rule value we expect.
-    assert CATEGORY_TO_GRAMMAR_RULE[
-        GeneralCategory.Space_Separator] == GrammarRule.WHITESPACE
-    assert CATEGORY_TO_GRAMMAR_RULE[
-        GeneralCategory.Other_Letter] == GrammarRule.IDENTIFIER_START
-    assert CATEGORY_TO_GRAMMAR_RULE[
-        GeneralCategory.Spacing_Mark] == GrammarRule.IDENTIFIER_PART
-    special_code_points = {
-        CodePoint(0x0009): GeneralCategory.Space_Separator,
-        CodePoint(0x000A): GeneralCategory.Space_Separator,
-        CodePoint(0x000B): GeneralCategory.Space_Separator,
-        CodePoint(0x000C): GeneralCategory.Space_Separator,
-        CodePoint(0x000D): GeneralCategory.Space_Separator,
-        CodePoint(0x0020): GeneralCategory.Space_Separator,
-        CodePoint(0x0024): GeneralCategory.Other_Letter,
-        CodePoint(0x005F): GeneralCategory.Other_Letter,
-        CodePoint(0x00A0): GeneralCategory.Space_Separator,
-        CodePoint(0x200C): GeneralCategory.Spacing_Mark,
-        CodePoint(0x200D): GeneralCategory.Spacing_Mark,
-        CodePoint(0xFEFF): GeneralCategory.Space_Separator
-    }
-    for code_point, cat in special_code_points.items():
-        database[code_point]['General_Category'] = cat
-    return database
+    for code_point, rule in SPECIAL_CODE_POINTS.items():
+        rules[code_point] = rule
+    return rules
 
 
 def dump_database(database: DbDict) -> None:
-    for key, value in database.items():
-        print(f'U+{key:04x} {value}')
+    write_lines([f'U+{key:04x} {value}' for key, value in database.items()])
+
+
+def header_prologue(include_guard: str, includes: Sequence[str]) -> list[str]:
+    """Produces the lines which start a generated C++ header file: the include
+    guard, the #include directives, and the grammar_rule enumeration.
+
+    :param include_guard: The name of the header file include guard to be used.
+    :param includes: The headers to be included.
+    :return: A list of lines.
+    """
+
+    lines = [
+        '// This file was auto-generated. DO NOT EDIT!',
+        f'#ifndef {include_guard}',
+        f'#define {include_guard}',
+    ]
+    lines.extend(f'#include {x}' for x in includes)
+    lines.append('namespace peejay {')
+    lines.append('enum class grammar_rule : std::uint8_t {')
+    lines.append(',\n'.join([f'  {rule_name(x)} = 0b{x:0>2b}' for x in GrammarRule]))
+    lines.append('};')
+    lines.append('constexpr auto idmask = 0b01U;')
+    return lines
+
+
+def header_epilogue(include_guard: str) -> list[str]:
+    """Produces the lines which end a generated C++ header file.
+
+    :param include_guard: The name of the header file include guard to be used.
+    :return: A list of lines.
+    """
+
+    return ['} // end namespace peejay', f'#endif // {include_guard}']
+
+
+def initializer_lines(values: Sequence[int],
+                      format_spec: str = '#04x') -> Iterator[str]:
+    """Formats a sequence of integers as the lines of a C++ initializer list,
+    sixteen values to a line.
+
+    :param values: The values to be formatted.
+    :param format_spec: The format specification used for each value.
+    :return: A generator which yields one line at a time.
+    """
+
+    for first in range(0, len(values), 16):
+        yield '  ' + ' '.join(f'{x:{format_spec}},' for x in values[first:first + 16])
+
 
+def ascii_table_lines(rules: bytes) -> list[str]:
+    """Produces the declaration of ascii_grammar_rule, a table which holds the
+    rule value (or NO_RULE) of each of the ASCII code points. The ASCII code
+    points are the most common in JSON text so the generated lookup function
+    consults this table before the general one.
 
-def emit_header(database: DbDict, entries: Sequence[OutputRow], include_guard: str) -> None:
-    """Emits a C++ header file which declares the array variable along with the
-    necessary types.
+    :param rules: A rule table as produced by read_rule_table().
+    :return: A list of lines.
+    """
+
+    lines = [f'inline constexpr std::array<std::uint8_t, {ASCII_SIZE}> ascii_grammar_rule = {{{{']
+    lines.extend(initializer_lines(rules[:ASCII_SIZE]))
+    lines.append('}};')
+    return lines
+
+
+# The start of the code_point_grammar_rule() body which handles the ASCII code
+# points by using the ascii_grammar_rule table.
+_ASCII_LOOKUP = f'''  if (code_point < ascii_grammar_rule.size ()) {{
+    auto const rule = ascii_grammar_rule[code_point];
+    if (rule == 0x{NO_RULE:X}) {{
+      return {{}};
+    }}
+    return static_cast<grammar_rule> (rule);
+  }}'''
+
+
+def write_lines(lines: Sequence[str]) -> None:
+    """Writes the complete output to stdout with a single call rather than
+    one per line.
+
+    :param lines: The lines to be written.
+    :return: None
+    """
 
-    :param database: The Unicode database dictionary.
-    :param entries: A sequence of OutputRow instances sorted by code point.
+    sys.stdout.write('\n'.join(lines))
+    sys.stdout.write('\n')
+
+
+def uint_least_type(max_value: int) -> str:
+    """Returns the name of the narrowest of the C++ std::uint_leastN_t types
+    which can represent values up to and including max_value.
+
+    :param max_value: The largest value that the type must represent.
+    :return: The name of a C++ unsigned integer type.
+    """
+
+    bits = next(x for x in (8, 16, 32) if max_value < 1 << x)
+    return f'std::uint_least{bits}_t'
+
+
+def emit_header(names: Mapping[CodePoint, str], rules: bytes, runs: CodeRuns,
+                include_guard: str) -> None:
+    """Emits a C++ header file which declares the arrays of code point runs
+    along with the necessary types and the code_point_grammar_rule() function
+    which searches them.
+
+    :param names: A mapping from code point to its name.
+    :param rules: A rule table as produced by read_rule_table().
+    :param runs: The code point runs as produced by code_run_array().
     :param include_guard: The name of the header file include guard to be used.
     :return: None
     """
 
-    print('// This file was auto-generated. DO NOT EDIT!')
-    print(f'#ifndef {include_guard}')
-    print(f'#define {include_guard}')
-    print('''#include <array>
-#include <cstdint>
-namespace peejay {
-enum class grammar_rule : std::uint8_t {''')
-    print(',\n'.join([f'  {rule_name(x)} = 0b{x.value:0>2b}' for x in GrammarRule]))
-    print(f'''}};
-constexpr auto idmask = 0b01U;
-struct cprun {{
-  std::uint_least32_t code_point: {CODE_POINT_BITS};
-  std::uint_least32_t length: {RUN_LENGTH_BITS};
-  std::uint_least32_t rule: {RULE_BITS};
-}};''')
-    assert CODE_POINT_BITS + RUN_LENGTH_BITS + RULE_BITS <= 32
-
-    print(f'inline std::array<cprun, {len(entries)}> const code_point_runs = {{{{')
-    for entry in entries:
-        print(f'  {entry.as_str(database)}')
-    print('}};')
-    print('\n} // end namespace peejay')
-    print(f'#endif // {include_guard}')
+    lines = header_prologue(include_guard, [
+        '<algorithm>', '<array>', '<cstddef>', '<cstdint>', '<iterator>',
+        '<optional>', '"peejay/portab.hpp"'
+    ])
+    size = len(runs.code_points)
+    lines.append(f'inline constexpr std::array<std::uint_least32_t, {size}> cprun_code_points = {{{{')
+    rule_names = {x: rule_name(x) for x in GrammarRule}
+    lines.extend(f'  {format_run(*run, names, rule_names)}' for run in zip(*runs))
+    lines.append('}};')
+    # Runs are never split so the length type is chosen to suit the longest.
+    length_type = uint_least_type(max(runs.lengths, default=0))
+    lines.append(f'inline constexpr std::array<{length_type}, {size}> cprun_lengths = {{{{')
+    lines.extend(initializer_lines(runs.lengths, 'd'))
+    lines.append('}};')
+    lines.append(f'inline constexpr std::array<std::uint8_t, {size}> cprun_rules = {{{{')
+    lines.extend(initializer_lines(runs.rules))
+    lines.append('}};')
+    lines.extend(ascii_table_lines(rules))
+    lines.append('''namespace details {
+PEEJAY_CONSTEXPR_CXX20 std::optional<grammar_rule> code_point_grammar_rule (
+    char32_t const code_point) noexcept {
+''' + _ASCII_LOOKUP + '''
+  // Find the last run which starts at or before code_point.
+  // NOLINTNEXTLINE(llvm-qualified-auto,readability-qualified-auto)
+  auto const begin = std::begin (cprun_code_points);
+  // NOLINTNEXTLINE(llvm-qualified-auto,readability-qualified-auto)
+  auto const it =
+      std::upper_bound (begin, std::end (cprun_code_points), code_point);
+  if (it == begin) {
+    return {};
+  }
+  auto const index = static_cast<std::size_t> (std::distance (begin, it) - 1);
+  if (code_point - cprun_code_points[index] >=
+      std::uint_least32_t{cprun_lengths[index]}) {
+    return {};
+  }
+  return static_cast<grammar_rule> (cprun_rules[index]);
+}
+} // end namespace details''')
+    lines.extend(header_epilogue(include_guard))
+    write_lines(lines)
+
+
+def emit_two_stage_header(rules: bytes, table: TwoStageTable,
+                          include_guard: str) -> None:
+    """Emits a C++ header file which declares a two-stage lookup table along
+    with the necessary types and the code_point_grammar_rule() function which
+    indexes it.
+
+    :param rules: A rule table as produced by read_rule_table().
+    :param table: The two-stage table.
+    :param include_guard: The name of the header file include guard to be used.
+    :return: None
+    """
+
+    lines = header_prologue(include_guard,
+                            ['<array>', '<cstddef>', '<cstdint>', '<optional>'])
+    lines.append(f'inline constexpr std::array<std::uint8_t, {len(table.stage1)}> cprun_stage1 = {{{{')
+    lines.extend(initializer_lines(table.stage1))
+    lines.append('}};')
+    lines.append(f'inline constexpr std::array<std::uint8_t, {len(table.stage2)}> cprun_stage2 = {{{{')
+    lines.extend(initializer_lines(table.stage2))
+    lines.append('}};')
+    lines.extend(ascii_table_lines(rules))
+    gap = ''
+    if table.gap_first < table.gap_last:
+        gap = f'''
+  // The pages of code points from U+{table.gap_first:04X} to U+{table.gap_last - 1:04X} contain no rules and are
+  // omitted from cprun_stage1.
+  if (code_point >= 0x{table.gap_first:X}) {{
+    if (code_point < 0x{table.gap_last:X}) {{
+      return {{}};
+    }}
+    offset -= 0x{table.gap_last - table.gap_first:X}U;
+  }}'''
+    lines.append(f'''namespace details {{
+constexpr std::optional<grammar_rule> code_point_grammar_rule (
+    char32_t const code_point) noexcept {{
+{_ASCII_LOOKUP}
+  // Code points from U+{table.limit:04X} onwards have no rule.
+  if (code_point >= 0x{table.limit:X}) {{
+    return {{}};
+  }}
+  auto offset = code_point;{gap}
+  auto const page = std::size_t{{cprun_stage1[offset >> {table.page_bits}U]}};
+  auto const index = (page << {table.page_bits}U) | (code_point & 0x{(1 << table.page_bits) - 1:X}U);
+  // Each byte of cprun_stage2 holds four two-bit rule values.
+  auto const rule = (cprun_stage2[index >> 2U] >> ((index & 0x3U) * 2U)) & 0x3U;
+  if (rule == 0b{PACKED_NO_RULE:0>2b}) {{
+    return {{}};
+  }}
+  return static_cast<grammar_rule> (rule);
+}}
+}} // end namespace details''')
+    lines.extend(header_epilogue(include_guard))
+    write_lines(lines)
 
 
 def main():
@@ -285,15 +553,22 @@ def main():
                        '--dump',
                        help='dump the Unicode code point database',
                        action='store_true')
+    group.add_argument('--two-stage',
+                       help='emit a two-stage lookup table rather than an array of code point runs',
+                       action='store_true')
 
     args = parser.parse_args()
-    database = read_unicode_data(args.unicode_data)
     if args.dump:
-        dump_database(database)
+        dump_database(read_unicode_data(args.unicode_data))
     else:
-        database = patch_special_code_points(database)
-        entries = code_run_array(database)
-        emit_header(database, entries, args.include_guard)
+        rules, names = read_rule_table(args.unicode_data)
+        rules = patch_special_code_points(rules)
+        if args.two_stage:
+            emit_two_stage_header(rules, smallest_two_stage_table(rules),
+                                  args.include_guard)
+        else:
+            emit_header(names, rules, code_run_array(rules),
+                        args.include_guard)
 
 if __name__ == '__main__':
     main ()
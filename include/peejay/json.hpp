@@ -581,24 +581,6 @@ constexpr std::optional<uint_least16_t> digit_offset (
   return std::nullopt;
 }
 
-PEEJAY_CONSTEXPR_CXX20 std::optional<grammar_rule> code_point_grammar_rule (
-    char32_t const code_point) noexcept {
-  // NOLINTNEXTLINE(llvm-qualified-auto,readability-qualified-auto)
-  auto const end = std::end (code_point_runs);
-  // NOLINTNEXTLINE(llvm-qualified-auto,readability-qualified-auto)
-  auto const it = std::lower_bound (
-      std::begin (code_point_runs), end,
-      cprun{code_point, 0, 0},
-      [] (cprun const& cpr, cprun const& value) {
-        return cpr.code_point + cpr.length < value.code_point;
-      });
-  if (it != end && code_point >= it->code_point &&
-      code_point < static_cast<char32_t> (it->code_point + it->length)) {
-    return static_cast<grammar_rule> (it->rule);
-  }
-  return {};
-}
-
 //*             _      _             *
 //*  _ __  __ _| |_ __| |_  ___ _ _  *
 //* | '  \/ _` |  _/ _| ' \/ -_) '_| *
@@ -11,8 +11,10 @@
 #  See <https://github.com/paulhuggett/peejay/blob/main/LICENSE.TXT>.
 #  SPDX-License-Identifier: Apache-2.0
 # ===----------------------------------------------------------------------===//
-from subprocess import run
-from os import walk
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from subprocess import CompletedProcess, run
+from os import cpu_count, scandir
 from os.path import join, split, splitext
 from pathlib import Path
 from typing import Generator
@@ -25,25 +27,62 @@ EXIT_FAILURE = 1
 def hidden (name:str) -> bool:
     return name.startswith(".")
 
-def enumerate_files (base_path:Path, ext:str) -> Generator[Path, None, None]:
-    for root, dirs, files in walk(base_path):
-        # Skip 'hidden' directories.
-        dirs[:] = [d for d in dirs if not hidden(d)]
-        # ... and hidden files.
-        files[:] = [f for f in files if not hidden(f)]
-        for name in files:
-            if splitext(name)[1] == ext:
-                yield Path(join(root, name))
+def enumerate_files (base_path:Path, extensions:set[str]) -> Generator[tuple[str, Path], None, None]:
+    """
+    Walks a directory hierarchy starting at base_path and yields each file
+    whose extension is one of 'extensions'. Like os.walk(), the files in a
+    directory are produced before those in its subdirectories.
+
+    :param base_path: The directory at which the walk starts.
+    :param extensions: The file extensions to be produced.
+    :result: A generator which yields a tuple containing the extension and
+             path of each matching file.
+    """
+
+    dirs = list()
+    try:
+        it = scandir(base_path)
+    except OSError:
+        # Like os.walk(), silently skip a directory which can't be read.
+        return
+    with it:
+        for entry in it:
+            # Skip 'hidden' directories and files.
+            if hidden(entry.name):
+                continue
+            # Like os.walk(), symbolic links to directories are not followed
+            # and are not treated as files either.
+            if entry.is_dir(follow_symlinks=False):
+                dirs.append(entry.path)
+            elif not entry.is_dir():
+                ext = splitext(entry.name)[1]
+                if ext in extensions:
+                    yield ext, Path(entry.path)
+    for d in dirs:
+        yield from enumerate_files(d, extensions)
+
+def check (pj_check:Path, path:Path) -> CompletedProcess:
+    """
+    Runs pj-check on a single file.
 
-def run_tests (test_dir:Path, pj_check:Path, extension:str, exit_code:int,
+    :param pj_check: The pj-check executable path.
+    :param path: The path of the file to be checked.
+    :result: The completed pj-check process.
+    """
+
+    return run([pj_check, path],
+               capture_output = True,
+               timeout = 5, # timeout in seconds
+               close_fds = True,
+               universal_newlines = True)
+
+def run_tests (paths:list[Path], pj_check:Path, exit_code:int,
                verbose:bool) -> list[bool]:
     """
-    Walks a directory hierarchy starting at test_dir and running pj-check on
-    each file that has the extension given by 'extension'.
+    Runs pj-check on each of the files given by 'paths'.
 
-    :param test_dir: The directory tree containing the test inputs.
+    :param paths: The paths of the test inputs.
     :param pj_check: The pj-check executable path.
-    :param extension: The file extension used by the tests to be parsed.
     :param exit_code: The expected exit code from pj-check. The test fails is
                       a different result is produced.
     :param verbose:  If true, verbose output is written to stdout.
@@ -52,15 +91,13 @@ def run_tests (test_dir:Path, pj_check:Path, extension:str, exit_code:int,
     """
 
     results = list()
-    for p in enumerate_files(test_dir, extension):
+    # The pj-check processes run concurrently. map() yields their results in
+    # the order of 'paths' so the output is the same as a sequential run.
+    with ThreadPoolExecutor(max_workers = cpu_count()) as executor:
+        processes = list(executor.map(partial(check, pj_check), paths))
+    for p, res in zip(paths, processes):
         if verbose:
             print(p)
-        res = run([pj_check, p],
-                  capture_output = True,
-                  timeout = 5, # timeout in seconds
-                  close_fds = True,
-                  universal_newlines = True)
-        if verbose:
             if len(res.stdout) > 0:
                 print(res.stdout)
             if len(res.stderr) > 0:
@@ -95,8 +132,12 @@ if __name__ == "__main__":
         print ("test-dir must be a directory", file=sys.stderr)
         sys.exit(EXIT_FAILURE)
     pj_check = args.path
+    # Walk the test directory once, sorting the files by extension.
+    files = {ext: list() for ext,_ in TESTS}
+    for ext, p in enumerate_files(test_dir, set(files)):
+        files[ext].append(p)
     # Run the tests producing a list of the results lists.
-    results = [run_tests (test_dir, pj_check, ext, expected, args.verbose) for ext,expected in TESTS]
+    results = [run_tests (files[ext], pj_check, expected, args.verbose) for ext,expected in TESTS]
     # Flatten the list.
     flat_results = [item for sublist in results for item in sublist]
     failures = flat_results.count(False)
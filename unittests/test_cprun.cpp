@@ -56,6 +56,59 @@ TEST (CodePointRun, MaxCodePoint) {
   EXPECT_FALSE (code_point_grammar_rule (char32_t{0x0010FFFF}));
 }
 
+// NOLINTNEXTLINE
+TEST (CodePointRun, AdjacentRuns) {
+  // A run of identifier_part code points which is immediately followed by a
+  // run of identifier_start code points.
+  static constexpr auto heta = char32_t{0x0370};  // GREEK CAPITAL LETTER HETA
+
+  EXPECT_EQ (code_point_grammar_rule (char32_t{heta - 1}),
+             std::optional{grammar_rule::identifier_part});
+  EXPECT_EQ (code_point_grammar_rule (heta),
+             std::optional{grammar_rule::identifier_start});
+}
+
+// NOLINTNEXTLINE
+TEST (CodePointRun, HebrewLetters) {
+  // The Hebrew letters are members of the Other_Letter (Lo) category.
+  static constexpr auto alef = char32_t{0x05D0};  // HEBREW LETTER ALEF
+  static constexpr auto tav = char32_t{0x05EA};   // HEBREW LETTER TAV
+
+  EXPECT_FALSE (code_point_grammar_rule (char32_t{alef - 1}));
+  EXPECT_EQ (code_point_grammar_rule (alef),
+             std::optional{grammar_rule::identifier_start});
+  EXPECT_EQ (code_point_grammar_rule (tav),
+             std::optional{grammar_rule::identifier_start});
+}
+
+// NOLINTNEXTLINE
+TEST (CodePointRun, LetterRanges) {
+  // UnicodeData.txt describes these Other_Letter (Lo) ranges with a pair of
+  // <..., First> and <..., Last> records. Every code point in a range shares
+  // its properties, not just the two ends.
+  static constexpr auto cjk_first = char32_t{0x4E00};  // CJK Ideograph, First
+  static constexpr auto cjk_last = char32_t{0x9FFF};   // CJK Ideograph, Last
+  static constexpr auto hangul_first = char32_t{0xAC00};  // Hangul Syllable
+  static constexpr auto hangul_last = char32_t{0xD7A3};   // Hangul Syllable
+  static constexpr auto ext_b_first = char32_t{0x20000};  // CJK Extension B
+
+  EXPECT_EQ (code_point_grammar_rule (cjk_first),
+             std::optional{grammar_rule::identifier_start});
+  EXPECT_EQ (code_point_grammar_rule (char32_t{cjk_first + 1}),
+             std::optional{grammar_rule::identifier_start});
+  EXPECT_EQ (code_point_grammar_rule (cjk_last),
+             std::optional{grammar_rule::identifier_start});
+
+  EXPECT_EQ (code_point_grammar_rule (char32_t{hangul_first + 1}),
+             std::optional{grammar_rule::identifier_start});
+  EXPECT_EQ (code_point_grammar_rule (hangul_last),
+             std::optional{grammar_rule::identifier_start});
+  EXPECT_FALSE (code_point_grammar_rule (char32_t{hangul_last + 1}));
+
+  EXPECT_EQ (code_point_grammar_rule (char32_t{ext_b_first + 1}),
+             std::optional{grammar_rule::identifier_start});
+}
+
 // NOLINTNEXTLINE
 TEST (CodePointRun, VariationSelector17) {
   static constexpr auto vs17 = char32_t{0xe0100};  // VARIATION SELECTOR-17